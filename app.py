@@ -1,12 +1,27 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import os
 import re
+from functools import lru_cache
 import streamlit.components.v1 as components
 
 # ================= CONFIG =================
 EXCEL_PATH = "XY.xlsx"
 SHEET_NAME = "Sheet1"
+USE_COLUMNS = {
+    "ota name",
+    "set up details",
+    "ari behaviour",
+    "reservation behaviour",
+    "other important points",
+}
+
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_ENGINE = "calamine"
+except ImportError:
+    EXCEL_ENGINE = "openpyxl"
 
 st.set_page_config(page_title="OTA Behaviour Search Tool", layout="wide")
 
@@ -36,8 +51,29 @@ st.caption("Voice or text → Apply → View details")
 st.markdown("---")
 
 # ================= LOAD DATA =================
-df = pd.read_excel(EXCEL_PATH, sheet_name=SHEET_NAME)
-df.columns = df.columns.str.strip()
+@st.cache_data(persist="disk")
+def load_df(path, sheet):
+    mtime = os.path.getmtime(path)
+    df = pd.read_excel(
+        path,
+        sheet_name=sheet,
+        engine=EXCEL_ENGINE,
+        usecols=lambda c: str(c).strip().lower() in USE_COLUMNS,
+        dtype="string[pyarrow]",
+    )
+    df.columns = df.columns.str.strip()
+    return mtime, df
+
+@st.cache_resource(max_entries=1)
+def get_df(path, sheet, mtime):
+    loaded_mtime, df = load_df(path, sheet)
+    if loaded_mtime != mtime:
+        load_df.clear(path, sheet)
+        loaded_mtime, df = load_df(path, sheet)
+    return df
+
+mtime = os.path.getmtime(EXCEL_PATH)
+df = get_df(EXCEL_PATH, SHEET_NAME, mtime)
 
 # ================= COLUMN MAP =================
 col_map = {c.lower(): c for c in df.columns}
@@ -50,22 +86,52 @@ RES_COL   = col("reservation behaviour")
 OTHER_COL = col("other important points")
 
 # ================= HELPERS =================
-def clean_text(t):
-    t = str(t).strip()
-    t = re.sub(r"\s+", " ", t)
-    t = re.sub(r":\s*", ": ", t)
-    return t[0].upper() + t[1:] if t else ""
+WS_RE = re.compile(r"\s+")
+COLON_RE = re.compile(r":\s*")
+BULLET_RE = re.compile(r"^[-•*]\s+")
+
+def clean_column(s):
+    s = s.dropna().astype(str).str.strip()
+    s = s.str.replace(BULLET_RE, "", regex=True)
+    s = s.str.replace(WS_RE, " ", regex=True)
+    s = s.str.replace(COLON_RE, ": ", regex=True)
+    return s.str[:1].str.upper() + s.str[1:]
+
+SPOKEN_RE = re.compile(r" dot | dotcom| con| ")
+SPOKEN_MAP = {" dot ": ".", " dotcom": ".com", " con": ".com", " ": ""}
 
+@lru_cache(maxsize=4096)
 def normalize_ota(t):
-    if not t:
+    if not isinstance(t, str) or not t:
         return ""
-    t = t.lower()
-    t = t.replace(" dot ", ".")
-    t = t.replace(" dotcom", ".com")
-    t = t.replace(" dot com", ".com")
-    t = t.replace(" con", ".com")
-    t = t.replace(" ", "")
-    return t
+    return SPOKEN_RE.sub(lambda m: SPOKEN_MAP[m[0]], t.casefold())
+
+# ================= INDEXES =================
+@st.cache_resource(max_entries=1)
+def build_ota_lookup(_df, mtime, ota_col):
+    names = np.array(_df[ota_col].dropna().astype(str).unique(), dtype=str)
+    norms = np.array([normalize_ota(n) for n in names], dtype=str)
+    return names, norms
+
+@st.cache_resource(max_entries=1)
+def build_detail_index(_df, mtime, ota_col, detail_cols):
+    named = _df[_df[ota_col].notna()]
+    ota_keys = (
+        named[ota_col].astype(str).astype("category")
+        .map(normalize_ota).astype("category")
+    )
+    index = {}
+    for ota, rows in named.groupby(ota_keys, sort=False, observed=True).indices.items():
+        ota_df = named.iloc[rows]
+        for c in detail_cols:
+            values = tuple(clean_column(ota_df[c]).unique())
+            index[(ota, c)] = (values, tuple(v.casefold() for v in values))
+    return index
+
+ota_names, ota_norms = build_ota_lookup(df, mtime, OTA_COL)
+detail_index = build_detail_index(
+    df, mtime, OTA_COL, (SETUP_COL, ARI_COL, RES_COL, OTHER_COL)
+)
 
 # ================= SESSION STATE =================
 if "voice_text" not in st.session_state:
@@ -133,15 +199,12 @@ with left:
     normalized_query = normalize_ota(ota_query)
 
     if normalized_query:
-        matches = df[
-            df[OTA_COL].astype(str).str.lower().apply(normalize_ota)
-            .str.contains(normalized_query)
-        ]
+        matches = ota_names[np.char.find(ota_norms, normalized_query) >= 0]
     else:
-        matches = pd.DataFrame()
+        matches = ota_names[:0]
 
-    if not matches.empty:
-        selected_ota = matches[OTA_COL].iloc[0]
+    if len(matches):
+        selected_ota = matches[0]
         st.markdown(
             f"<div class='selected-box'><b>Selected OTA:</b> {selected_ota}</div>",
             unsafe_allow_html=True
@@ -159,11 +222,6 @@ with left:
 # ================= RIGHT =================
 with right:
     if selected_ota:
-        ota_df = df[
-            df[OTA_COL].astype(str).str.lower().apply(normalize_ota)
-            == normalize_ota(selected_ota)
-        ]
-
         col_map_opt = {
             "Setup Details": SETUP_COL,
             "ARI Behaviour": ARI_COL,
@@ -178,18 +236,24 @@ with right:
         detail_search = st.text_input(
             "Search inside details",
             placeholder="payment, cvv, allocation..."
-        ).lower()
+        ).casefold()
 
         st.markdown("<div class='section-box'>", unsafe_allow_html=True)
 
-        shown = False
-        for v in ota_df[active_col].dropna().unique():
-            txt = clean_text(v)
-            if not detail_search or detail_search in txt.lower():
-                st.markdown(f"- {txt}")
-                shown = True
+        details, details_folded = detail_index.get(
+            (normalize_ota(selected_ota), active_col), ((), ())
+        )
+        if detail_search:
+            items = [
+                txt for txt, folded in zip(details, details_folded)
+                if detail_search in folded
+            ]
+        else:
+            items = details
 
-        if not shown:
+        if items:
+            st.markdown("- " + "\n- ".join(items))
+        else:
             st.info("No matching details found.")
 
         st.markdown("</div>", unsafe_allow_html=True)